@@ -25,6 +25,9 @@ Usage:
     # Announce on startup
     await announcer.announce()
 
+    # Close the shared NATS connection on shutdown
+    await announcer.close()
+
     # Or use the convenience function
     await announce_service(
         slug="my-service",
@@ -36,22 +39,62 @@ Usage:
 
 NATS Subject: services.announce.v1
 Message Format: JSON with slug, name, url, health_check, tier, port, timestamp, metadata
+    timestamp is ISO 8601 in UTC with a "Z" suffix, e.g.
+    "2025-01-01T12:00:00.123456Z"; from_json() parses it back to an aware
+    datetime, so from_json(a.to_bytes()) == a round-trips.
 """
 
 import asyncio
-import json
 import os
+import random
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
+
+import json
+
+
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_json_default).encode()
+
 
+# Prefer orjson (Rust, emits bytes directly) and fall back to stdlib json
+try:
+    import orjson
+
+    # orjson writes datetimes natively as RFC 3339 with a "Z" suffix, and
+    # stringifies non-str dict keys the way json.dumps does
+    _DUMPS_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+        except TypeError:
+            # Values json.dumps accepts but orjson rejects (e.g. ints
+            # beyond 64 bits) still publish, just on the slow path
+            return _json_dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = _json_dumps
+    _loads = json.loads  # type: ignore[assignment]
 
 # Import ServiceTier from shared types if available, otherwise define locally
 try:
-    from pmoves_common import ServiceTier
+    from pmoves_common import ServiceTier, nats_error_cb
 except ImportError:
     from enum import Enum
 
+    nats_error_cb = None  # type: ignore[assignment]  # nats-py logs errors itself
+
     class ServiceTier(str, Enum):
         """PMOVES service tiers (6-tier architecture)."""
         DATA = "data"
@@ -62,55 +105,99 @@ except ImportError:
         WORKER = "worker"
 
 
-@dataclass
+def _utc_now() -> datetime:
+    """Current UTC time; left unformatted for the serializer to write."""
+    return datetime.now(timezone.utc)
+
+
+# Upper bound for a single announce_with_retry() backoff sleep
+MAX_RETRY_DELAY = 30.0
+
+# Default for how long a publish waits on the initial NATS connection; the
+# connect keeps retrying in the background after a publish gives up
+NATS_CONNECT_TIMEOUT = float(os.getenv("NATS_CONNECT_TIMEOUT", "2.0"))
+
+# Tier value -> enum member; also used to validate tiers when parsing messages
+_TIER_CACHE: Dict[str, ServiceTier] = {t.value: t for t in ServiceTier}
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceAnnouncement:
     """
     Service announcement message format for NATS.
 
     Services publish announcements on the `services.announce.v1` subject
     to notify other services of their availability and configuration.
+
+    Announcements are immutable and serialized once at construction;
+    create a new instance to publish a refreshed timestamp.
+
+    Caveats of the cached payload:
+    - frozen=True doesn't cover the metadata dict, and mutating it in
+      place is not reflected in to_bytes(); build a new announcement.
+    - The payload is stored in the _cached_bytes field, so
+      dataclasses.asdict() includes it as bytes (and the timestamp as a
+      datetime). Use json.loads(a.to_bytes()) for a JSON-ready dict.
     """
 
     slug: str
     name: str
     url: str
     health_check: str
-    tier: ServiceTier
+    tier: ServiceTier | str  # Normalized to the plain tier value
     port: int
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    # datetime objects are serialized as ISO 8601 with a "Z" suffix; strings
+    # are passed through. from_json() always yields a datetime.
+    timestamp: datetime | str = field(default_factory=_utc_now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _cached_bytes: bytes = field(init=False, repr=False, compare=False)
 
     # NATS subject for announcements
-    SUBJECT: str = "services.announce.v1"
+    SUBJECT: ClassVar[str] = "services.announce.v1"
 
-    def to_json(self) -> str:
-        """Convert to JSON for NATS publishing."""
+    def __post_init__(self):
+        tier = self.tier.value if isinstance(self.tier, ServiceTier) else str(self.tier)
+        object.__setattr__(self, "tier", tier)
         data = {
             "slug": self.slug,
             "name": self.name,
             "url": self.url,
             "health_check": self.health_check,
-            "tier": self.tier.value if isinstance(self.tier, ServiceTier) else self.tier,
+            "tier": self.tier,
             "port": self.port,
             "timestamp": self.timestamp,
             "metadata": self.metadata,
         }
-        return json.dumps(data)
+        object.__setattr__(self, "_cached_bytes", _dumps(data))
+
+    def to_bytes(self) -> bytes:
+        """Return the JSON bytes for NATS publishing."""
+        return self._cached_bytes
+
+    def to_json(self) -> str:
+        """Convert to a JSON string (kept for backward compatibility)."""
+        return self.to_bytes().decode()
 
     @classmethod
-    def from_json(cls, data: str | dict) -> "ServiceAnnouncement":
-        """Parse from JSON message."""
-        if isinstance(data, str):
-            data = json.loads(data)
+    def from_json(cls, data: str | bytes | dict) -> "ServiceAnnouncement":
+        """Parse from JSON message (str, raw NATS bytes, or decoded dict)."""
+        msg: Dict[str, Any] = (
+            _loads(data) if isinstance(data, (str, bytes, bytearray)) else data
+        )
+        get = msg.get
+        tier = msg["tier"]
+        if tier not in _TIER_CACHE:
+            raise ValueError(f"{tier!r} is not a valid ServiceTier")
+        timestamp = get("timestamp")
         return cls(
-            slug=data["slug"],
-            name=data["name"],
-            url=data["url"],
-            health_check=data["health_check"],
-            tier=ServiceTier(data["tier"]),
-            port=data["port"],
-            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
-            metadata=data.get("metadata", {}),
+            msg["slug"],
+            msg["name"],
+            msg["url"],
+            msg["health_check"],
+            tier,
+            msg["port"],
+            datetime.fromisoformat(timestamp) if timestamp else _utc_now(),
+            get("metadata") or {},
         )
 
 
@@ -131,6 +218,7 @@ class ServiceAnnouncer:
         health_check: str = None,
         nats_url: str = None,
         metadata: Dict[str, Any] = None,
+        connect_timeout: float = None,
     ):
         """
         Initialize the service announcer.
@@ -144,58 +232,167 @@ class ServiceAnnouncer:
             health_check: Health check URL (defaults to url + /healthz)
             nats_url: NATS server URL (defaults to NATS_URL env var)
             metadata: Additional service metadata
+            connect_timeout: Seconds a publish waits for the initial NATS
+                connection (defaults to NATS_CONNECT_TIMEOUT)
         """
         self.slug = slug
         self.name = name
         self.url = url
         self.port = port
 
-        if isinstance(tier, str):
-            tier = ServiceTier(tier.lower())
+        if isinstance(tier, str) and not isinstance(tier, ServiceTier):
+            value = tier.lower()
+            tier = _TIER_CACHE.get(value) or ServiceTier(value)
         self.tier = tier
+        self.tier_str = tier.value
 
         self.health_check = health_check or f"{url.rstrip('/')}/healthz"
         self.nats_url = nats_url or os.getenv("NATS_URL", "nats://nats:4222")
         self.metadata = metadata or {}
 
-    def create_announcement(self) -> ServiceAnnouncement:
+        self.connect_timeout = (
+            NATS_CONNECT_TIMEOUT if connect_timeout is None else connect_timeout
+        )
+
+        # Long-lived NATS connection, created lazily on first publish and
+        # connected by a background task
+        self._nc: Optional[Any] = None  # nats Client, created lazily
+        self._connect_task: Optional["asyncio.Future[None]"] = None
+
+    def _start_connect(self):
+        """Create the shared NATS client and start connecting it."""
+        from nats.aio.client import Client as NATS
+
+        nc = NATS()
+        # Unlimited reconnects keep an established connection alive and also
+        # retry the first connect until it succeeds
+        task = asyncio.ensure_future(
+            nc.connect(
+                self.nats_url,
+                error_cb=nats_error_cb(f"ServiceAnnouncer({self.slug})")
+                if nats_error_cb is not None
+                else None,
+                connect_timeout=2,
+                allow_reconnect=True,
+                max_reconnect_attempts=-1,
+                reconnect_time_wait=1,
+            )
+        )
+        # Retrieve a failure so it is not reported as "never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._nc, self._connect_task = nc, task
+        return nc, task
+
+    async def _get_nc(self):
+        """
+        Return the shared NATS client, connecting on first use.
+
+        Waits at most connect_timeout seconds for the initial connection and
+        raises ConnectionError if it is not up by then; the connect keeps
+        running so a later publish can succeed.
+        """
+        nc, task = self._nc, self._connect_task
+        if (
+            nc is None
+            or nc.is_closed
+            or (task is not None and task.done() and (
+                task.cancelled() or task.exception() is not None
+            ))
+        ):
+            nc, task = self._start_connect()
+
+        if task is not None and not task.done():
+            await asyncio.wait({task}, timeout=self.connect_timeout)
+            if not task.done():
+                raise ConnectionError(
+                    f"NATS at {self.nats_url} not connected "
+                    f"after {self.connect_timeout}s"
+                )
+            task.result()
+        return nc
+
+    async def close(self, flush_timeout: float = 5.0) -> None:
+        """Drain pending announcements and close the shared NATS connection."""
+        nc, self._nc = self._nc, None
+        task, self._connect_task = self._connect_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if nc is not None and not nc.is_closed:
+            try:
+                if nc.is_connected:
+                    await nc.flush(timeout=flush_timeout)
+                await nc.close()
+            except Exception as e:
+                print(f"Failed to close NATS connection: {e}")
+
+    def create_announcement(
+        self, timestamp: Optional[datetime | str] = None
+    ) -> ServiceAnnouncement:
         """Create a service announcement object."""
         return ServiceAnnouncement(
             slug=self.slug,
             name=self.name,
             url=self.url,
             health_check=self.health_check,
-            tier=self.tier,
+            tier=self.tier_str,
             port=self.port,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=timestamp or _utc_now(),
             metadata=self.metadata,
         )
 
-    async def announce(self) -> bool:
+    async def publish(self, payload: bytes, flush: bool = False) -> bool:
         """
-        Publish service announcement to NATS.
+        Publish a pre-serialized announcement payload to NATS.
+
+        Args:
+            payload: JSON-encoded announcement bytes
+            flush: Wait for the server round-trip before returning
 
         Returns:
             True if announcement published successfully
         """
         try:
-            from nats.aio.client import Client as NATS
-
-            announcement = self.create_announcement()
-
-            nc = await NATS.connect(self.nats_url, connect_timeout=5)
-            await nc.publish(
-                ServiceAnnouncement.SUBJECT,
-                announcement.to_json().encode(),
-            )
-            await nc.flush()
-            await nc.close()
+            nc = await self._get_nc()
+            await nc.publish(ServiceAnnouncement.SUBJECT, payload)
+            if flush:
+                await nc.flush()
 
             return True
         except Exception as e:
             print(f"Failed to announce service: {e}")
             return False
 
+    async def _announce(self, flush: bool) -> bool:
+        """Build a fresh announcement and publish it, reporting any failure."""
+        try:
+            payload = self.create_announcement().to_bytes()
+        except Exception as e:  # e.g. metadata that can't be serialized
+            print(f"Failed to announce service: {e}")
+            return False
+        return await self.publish(payload, flush=flush)
+
+    async def announce(self) -> bool:
+        """
+        Publish service announcement to NATS without waiting for a flush.
+
+        The message is queued in the client's pending buffer and sent in
+        the background; use announce_sync() to confirm delivery.
+
+        Returns:
+            True if announcement was queued successfully
+        """
+        return await self._announce(flush=False)
+
+    async def announce_sync(self) -> bool:
+        """
+        Publish service announcement to NATS and flush.
+
+        Returns:
+            True if announcement published successfully
+        """
+        return await self._announce(flush=True)
+
     async def announce_with_retry(
         self, max_retries: int = 3, delay: float = 1.0
     ) -> bool:
@@ -204,16 +401,25 @@ class ServiceAnnouncer:
 
         Args:
             max_retries: Maximum number of retry attempts
-            delay: Delay between retries in seconds
+            delay: Base delay between retries in seconds; doubles per attempt
+                with up to 25% jitter, capped at MAX_RETRY_DELAY
 
         Returns:
             True if announcement published successfully
         """
-        for attempt in range(max_retries):
-            if await self.announce():
+        if max_retries < 1:
+            return False
+
+        # Exponential backoff with jitter so replicas don't re-announce in lockstep
+        sleeps = [
+            min(delay * (1 << i) + random.random() * 0.25 * delay, MAX_RETRY_DELAY)
+            for i in range(max_retries - 1)
+        ]
+        for sleep_s in (*sleeps, None):
+            if await self.announce_sync():
                 return True
-            if attempt < max_retries - 1:
-                await asyncio.sleep(delay * (2**attempt))  # Exponential backoff
+            if sleep_s is not None:
+                await asyncio.sleep(sleep_s)
         return False
 
 
@@ -263,7 +469,15 @@ async def announce_service(
         nats_url=nats_url,
         metadata=metadata,
     )
-    return await announcer.announce()
+    try:
+        return await announcer.announce_sync()
+    finally:
+        await announcer.close()
+
+
+# Placeholder spliced with a fresh timestamp on each background tick
+_TIMESTAMP_PLACEHOLDER = "__PMOVES_TIMESTAMP__"
+_TIMESTAMP_TOKEN = _dumps(_TIMESTAMP_PLACEHOLDER)
 
 
 class BackgroundAnnouncer:
@@ -271,8 +485,12 @@ class BackgroundAnnouncer:
     Background service announcer that announces periodically.
 
     Useful for services that want to periodically re-announce themselves.
+    The announcement is serialized once; each tick only splices in a new
+    timestamp. Call invalidate() after mutating the announcer's fields.
     """
 
+    __slots__ = ("announcer", "interval", "_running", "_task", "_template")
+
     def __init__(
         self,
         announcer: ServiceAnnouncer,
@@ -289,11 +507,35 @@ class BackgroundAnnouncer:
         self.interval = interval
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._template: Optional[bytes] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached payload so the next tick re-serializes it."""
+        self._template = None
+
+    def _payload(self) -> bytes:
+        """Return the cached announcement bytes with a fresh timestamp."""
+        if self._template is None:
+            announcement = self.announcer.create_announcement(
+                timestamp=_TIMESTAMP_PLACEHOLDER
+            )
+            self._template = announcement.to_bytes()
+        timestamp = _dumps(_utc_now())
+        return self._template.replace(_TIMESTAMP_TOKEN, timestamp, 1)
+
+    async def _publish(self) -> bool:
+        """Publish one tick, reporting failures instead of raising."""
+        try:
+            payload = self._payload()
+        except Exception as e:  # e.g. metadata that can't be serialized
+            print(f"Failed to announce service: {e}")
+            return False
+        return await self.announcer.publish(payload)
 
     async def _announce_loop(self):
         """Internal announcement loop."""
         while self._running:
-            await self.announcer.announce()
+            await self._publish()
             await asyncio.sleep(self.interval)
 
     async def start(self):
@@ -302,7 +544,7 @@ class BackgroundAnnouncer:
             self._running = True
             self._task = asyncio.create_task(self._announce_loop())
             # Initial announcement
-            await self.announcer.announce()
+            await self._publish()
 
     async def stop(self):
         """Stop background announcements."""
@@ -314,6 +556,7 @@ class BackgroundAnnouncer:
                     await self._task
                 except asyncio.CancelledError:
                     pass
+            await self.announcer.close()
 
 
 # Example usage and testing
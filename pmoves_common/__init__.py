@@ -1,19 +1,28 @@
 """
 PMOVES.AI Common Types Module
 
-Shared type definitions used across all PMOVES services.
+Shared type definitions and helpers used across all PMOVES services.
 This module should be imported as a dependency to ensure type consistency
 across the PMOVES.AI ecosystem.
 
 Usage:
-    from pmoves_common import ServiceTier, HealthStatus
+    from pmoves_common import ServiceTier, HealthStatus, LoopLocal
 
     tier = ServiceTier.API
     if tier == ServiceTier.AGENT:
         print("Agent tier service")
+
+    # One loop-bound resource per running event loop
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal()
+    client = _clients.get() or _clients.set(httpx.AsyncClient())
 """
 
+import asyncio
+import time
 from enum import Enum
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 class ServiceTier(str, Enum):
@@ -41,17 +50,85 @@ class ServiceTier(str, Enum):
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Check if a string value is a valid tier."""
-        return value in (t.value for t in cls)
+        return value in _TIER_VALUES
 
     def __str__(self) -> str:
         return self.value
 
 
+# Precomputed tier values for O(1) membership checks in is_valid()
+_TIER_VALUES = frozenset(t.value for t in ServiceTier)
+
+
 class HealthStatus(str, Enum):
     """Health status constants for service health checks."""
     HEALTHY = "healthy"
     DEGRADED = "degraded"
     UNHEALTHY = "unhealthy"
 
+    def __str__(self) -> str:
+        return self.value
+
+
+class LoopLocal(Generic[T]):
+    """
+    One value per running asyncio event loop, like threading.local for loops.
+
+    Loop-bound resources (HTTP clients, NATS connections, locks) can't be
+    used from another loop, and can't be closed once their loop is gone.
+    Each entry keeps its loop next to the value, so the loop's id is not
+    reused while the entry exists. Entries for closed loops are dropped
+    whenever a new loop stores a value. Call only from a running loop.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[asyncio.AbstractEventLoop, T]] = {}
+
+    def get(self) -> Optional[T]:
+        """Return the running loop's value, or None if it has none."""
+        entry = self._entries.get(id(asyncio.get_running_loop()))
+        return None if entry is None else entry[1]
+
+    def set(self, value: T) -> T:
+        """Store value for the running loop and return it."""
+        loop = asyncio.get_running_loop()
+        if id(loop) not in self._entries:
+            # Values of closed loops can no longer be used or awaited; drop them
+            for loop_id, (other, _) in list(self._entries.items()):
+                if other.is_closed():
+                    del self._entries[loop_id]
+        self._entries[id(loop)] = (loop, value)
+        return value
+
+    def pop(self) -> Optional[T]:
+        """Remove and return the running loop's value, or None if it has none."""
+        entry = self._entries.pop(id(asyncio.get_running_loop()), None)
+        return None if entry is None else entry[1]
+
+
+def nats_error_cb(
+    label: str, interval: float = 60.0
+) -> Callable[[Exception], Awaitable[None]]:
+    """
+    Build a nats-py error_cb that prints one line per distinct error.
+
+    nats-py's default callback logs a full traceback on every failed
+    (re)connect attempt. This prints the first occurrence of each error
+    message, then repeats it at most once per interval seconds.
+    """
+    last: Dict[str, float] = {}
+
+    async def error_cb(e: Exception) -> None:
+        message = f"{type(e).__name__}: {e}"
+        now = time.monotonic()
+        if now - last.get(message, -interval) >= interval:
+            last.clear()
+            last[message] = now
+            print(f"{label}: NATS error: {message}")
+
+    return error_cb
+
 
-__all__ = ["ServiceTier", "HealthStatus"]
+__all__ = ["ServiceTier", "HealthStatus", "LoopLocal", "nats_error_cb"]
@@ -9,6 +9,7 @@ This module provides:
 - DependencyCheck: Base class for creating custom health checks
 - DatabaseCheck, HTTPCheck, NATSCheck: Pre-built check implementations
 - health_check(): Decorator for registering checks
+- aclose_all_http_checks(): Shutdown hook for the shared HTTP client
 - create_health_app(): Factory for creating standalone health apps
 - health_check_router: FastAPI router for adding to existing apps
 
@@ -16,6 +17,7 @@ Health Endpoint Behavior:
 - Returns HTTP 200 when status is "healthy" or "degraded"
 - Returns HTTP 503 when status is "unhealthy"
 - Includes timestamp, service name, and individual check results
+- Results are cached for HEALTH_CHECK_CACHE_TTL seconds across requests
 
 Usage:
     from pmoves_health import create_health_app, HealthChecker, NATSCheck
@@ -38,118 +40,246 @@ Health Status Values:
 - unhealthy: One or more required checks failing
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from functools import wraps
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import os
 import asyncio
+import time
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
 try:
     from fastapi import APIRouter, HTTPException
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import Response
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+from pmoves_common import LoopLocal, nats_error_cb
+
 
 # Health check configuration
 HEALTH_CHECK_PATH = "/healthz"
 HEALTH_CHECK_TIMEOUT = 5.0
+HEALTH_CHECK_CACHE_TTL = 1.0  # Seconds a result is reused across requests
 
+# Idle HTTPCheck connections must outlive the probe interval (typically
+# 10s in k8s) to be reused; httpx's default of 5s would drop them first
+HTTP_CHECK_KEEPALIVE_EXPIRY = 60.0
 
-class HealthStatus:
-    """Health status constants."""
-    HEALTHY = "healthy"
-    DEGRADED = "degraded"
-    UNHEALTHY = "unhealthy"
+# Response keys shared by every status dict
+_KEY_STATUS = "status"
+_KEY_SERVICE = "service"
+_KEY_TIMESTAMP = "timestamp"
+
+
+# Import HealthStatus from shared types if available, otherwise define locally
+try:
+    from pmoves_common import HealthStatus
+except ImportError:
+    class HealthStatus:  # type: ignore[no-redef]
+        """Health status constants."""
+        HEALTHY = "healthy"
+        DEGRADED = "degraded"
+        UNHEALTHY = "unhealthy"
 
 
 class DependencyCheck:
     """Base class for dependency health checks."""
 
+    __slots__ = ("name", "required", "_status_key")
+
     def __init__(self, name: str, required: bool = True):
         self.name = name
         self.required = required
+        self._status_key = f"{name.lower().replace(' ', '_')}_connected"
 
     async def check(self) -> bool:
         """Check if dependency is healthy. Override in subclass."""
         raise NotImplementedError
 
+    async def close(self) -> None:
+        """Release any resources held by the check. Override if needed."""
+
     def status_key(self) -> str:
         """Return the status key for this check."""
-        return f"{self.name.lower().replace(' ', '_')}_connected"
+        return self._status_key
 
 
 class DatabaseCheck(DependencyCheck):
-    """Health check for database connections."""
+    """Health check for database connections.
+
+    Async connect functions are awaited directly; sync ones run in a
+    worker thread so they don't block the event loop.
+    """
+
+    __slots__ = ("connect_fn", "_is_coro")
 
     def __init__(self, connect_fn: Callable, **kwargs):
         super().__init__("database", kwargs.get("required", True))
         self.connect_fn = connect_fn
+        self._is_coro = asyncio.iscoroutinefunction(connect_fn)
 
     async def check(self) -> bool:
         try:
-            return await asyncio.to_thread(self.connect_fn)
+            if self._is_coro:
+                return bool(await self.connect_fn())
+            return bool(await asyncio.to_thread(self.connect_fn))
         except Exception:
             return False
 
 
 class HTTPCheck(DependencyCheck):
-    """Health check for HTTP endpoints."""
+    """Health check for HTTP endpoints.
+
+    All HTTPCheck instances on an event loop share one keep-alive
+    AsyncClient, so repeated probes reuse pooled connections. Close it with
+    aclose_all_http_checks().
+    """
+
+    __slots__ = ("url",)
 
     def __init__(self, url: str, **kwargs):
         name = kwargs.get("name", "service")
         super().__init__(name, kwargs.get("required", True))
         self.url = url
 
+    @staticmethod
+    def _get_client():
+        """Return the running loop's shared AsyncClient, creating it on first use."""
+        client = _HTTP_CLIENTS.get()
+        if client is None or client.is_closed:
+            import httpx
+            client = _HTTP_CLIENTS.set(
+                httpx.AsyncClient(
+                    timeout=2.0,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10,
+                        keepalive_expiry=HTTP_CHECK_KEEPALIVE_EXPIRY,
+                    ),
+                )
+            )
+        return client
+
     async def check(self) -> bool:
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(self.url)
-                return response.status_code == 200
+            response = await self._get_client().get(self.url)
+            return response.status_code == 200
         except Exception:
             return False
 
 
+# AsyncClient shared by HTTPCheck instances, one per event loop
+_HTTP_CLIENTS: LoopLocal[Any] = LoopLocal()
+
+
+async def aclose_all_http_checks() -> None:
+    """Close the running loop's AsyncClient shared by HTTPCheck instances."""
+    client = _HTTP_CLIENTS.pop()
+    if client is not None:
+        await client.aclose()
+
+
 class NATSCheck(DependencyCheck):
-    """Health check for NATS connection."""
+    """Health check for NATS connection.
+
+    Keeps one auto-reconnecting client open per event loop and reports its
+    connection state, instead of connecting and closing on every probe.
+    The client connects in a background task, so a probe never waits on
+    NATS; it reports False until the connection is up.
+    """
+
+    __slots__ = ("nats_url", "_conns")
 
     def __init__(self, nats_url: str, **kwargs):
         super().__init__("nats", kwargs.get("required", True))
         self.nats_url = nats_url
+        # (nats Client, connect task) per event loop, created lazily
+        self._conns: LoopLocal[Tuple[Any, "asyncio.Future[None]"]] = LoopLocal()
+
+    def _start_connect(self) -> Tuple[Any, "asyncio.Future[None]"]:
+        """Create this loop's client and start connecting it in the background."""
+        from nats.aio.client import Client as NATS
+        nc = NATS()
+        # Unlimited reconnects also retry the first connect until it succeeds
+        task = asyncio.ensure_future(
+            nc.connect(
+                self.nats_url,
+                error_cb=nats_error_cb(f"NATSCheck({self.nats_url})"),
+                connect_timeout=2,
+                allow_reconnect=True,
+                max_reconnect_attempts=-1,
+                ping_interval=10,
+                max_outstanding_pings=2,
+            )
+        )
+        # Retrieve a failure so it is not reported as "never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return self._conns.set((nc, task))
 
     async def check(self) -> bool:
-        nc = None
         try:
-            from nats.aio.client import Client as NATS
-            nc = await NATS.connect(self.nats_url, connect_timeout=2)
-            return True
+            conn = self._conns.get()
+            if conn is not None:
+                nc, task = conn
+                if task.done() and (
+                    task.cancelled() or task.exception() is not None or nc.is_closed
+                ):
+                    conn = None
+            if conn is None:
+                conn = self._start_connect()
+            return conn[0].is_connected
         except Exception:
             return False
-        finally:
-            if nc:
-                try:
-                    await nc.close()
-                except Exception:
-                    pass
+
+    async def close(self) -> None:
+        conn = self._conns.pop()
+        if conn is None:
+            return
+        nc, task = conn
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if not nc.is_closed:
+            try:
+                await nc.close()
+            except Exception:
+                pass
 
 
 class HealthChecker:
     """Health checker with multiple dependency checks."""
 
+    __slots__ = ("service_name", "checks", "custom_checks", "_cache", "_locks")
+
     def __init__(self, service_name: str = None):
         self.service_name = service_name or os.getenv("SERVICE_NAME", "unknown")
         self.checks: List[DependencyCheck] = []
         self.custom_checks: Dict[str, Callable] = {}
+        # (monotonic time, results, serialized results) of the last run
+        self._cache: Optional[Tuple[float, Dict[str, Any], bytes]] = None
+        # asyncio.Lock binds to the loop it is first contended on
+        self._locks: LoopLocal[asyncio.Lock] = LoopLocal()
 
     def add_check(self, check: DependencyCheck) -> None:
         """Add a dependency check."""
         self.checks.append(check)
+        self._cache = None
 
     def add_custom_check(self, name: str, check_fn: Callable) -> None:
         """Add a custom health check function."""
         self.custom_checks[name] = check_fn
+        self._cache = None
 
     def database(self, connect_fn: Callable) -> None:
         """Add a database health check."""
@@ -163,51 +293,97 @@ class HealthChecker:
         """Add a NATS health check."""
         self.add_check(NATSCheck(nats_url))
 
-    async def check_all(self) -> Dict[str, Any]:
-        """Run all health checks and return status."""
+    async def close(self) -> None:
+        """Release resources (e.g. open connections) held by the checks."""
+        for check in self.checks:
+            try:
+                await check.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    async def _run_custom_check(check_fn: Callable) -> Any:
+        """Call a custom check function, awaiting it if it is async."""
+        return await check_fn() if asyncio.iscoroutinefunction(check_fn) else check_fn()
+
+    async def snapshot(
+        self, max_age: float = HEALTH_CHECK_CACHE_TTL
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Return the health status and its JSON bytes, reusing recent results.
+
+        Results younger than max_age seconds are served from cache. Only one
+        recheck runs at a time; concurrent callers wait for and share it.
+        """
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < max_age:
+            return cache[1], cache[2]
+
+        lock = self._locks.get() or self._locks.set(asyncio.Lock())
+        async with lock:
+            cache = self._cache
+            if cache is not None and time.monotonic() - cache[0] < max_age:
+                return cache[1], cache[2]
+
+            results = await self._run_checks()
+            body = _dumps(results)
+            self._cache = (time.monotonic(), results, body)
+            return results, body
+
+    async def check_all(self, max_age: float = HEALTH_CHECK_CACHE_TTL) -> Dict[str, Any]:
+        """Run all health checks (or reuse a recent result) and return status."""
+        results, _ = await self.snapshot(max_age)
+        return dict(results)
+
+    async def _run_checks(self) -> Dict[str, Any]:
+        """Run all health checks concurrently and return status."""
         results = {
-            "status": HealthStatus.HEALTHY,
-            "service": self.service_name,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            _KEY_STATUS: HealthStatus.HEALTHY,
+            _KEY_SERVICE: self.service_name,
+            _KEY_TIMESTAMP: datetime.now(timezone.utc).isoformat(),
         }
 
+        # (result key, required) for each check, in task order.
+        # Custom checks are always treated as required.
+        meta = [(check.status_key(), check.required) for check in self.checks]
+        meta += [(name, True) for name in self.custom_checks]
+
+        tasks = [asyncio.ensure_future(check.check()) for check in self.checks]
+        tasks += [
+            asyncio.ensure_future(self._run_custom_check(fn))
+            for fn in self.custom_checks.values()
+        ]
+
+        # Checks still running at the timeout are cancelled and count as
+        # failures; finished ones keep their own result.
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=HEALTH_CHECK_TIMEOUT)
+            for task in pending:
+                task.cancel()
+
         all_healthy = True
         some_degraded = False
 
-        # Run dependency checks
-        for check in self.checks:
-            try:
-                is_healthy = await check.check()
-                results[check.status_key()] = is_healthy
-
-                if not is_healthy:
-                    if check.required:
-                        all_healthy = False
-                    else:
-                        some_degraded = True
-            except Exception as e:
-                results[check.status_key()] = False
-                if check.required:
+        for (key, required), task in zip(meta, tasks):
+            # Errors count as failures rather than propagating
+            is_healthy = (
+                task.done()
+                and not task.cancelled()
+                and task.exception() is None
+                and bool(task.result())
+            )
+            results[key] = is_healthy
+            if not is_healthy:
+                if required:
                     all_healthy = False
                 else:
                     some_degraded = True
 
-        # Run custom checks
-        for name, check_fn in self.custom_checks.items():
-            try:
-                result = await check_fn() if asyncio.iscoroutinefunction(check_fn) else check_fn()
-                results[name] = bool(result)
-                if not result:
-                    all_healthy = False
-            except Exception:
-                results[name] = False
-                all_healthy = False
-
         # Determine overall status
         if not all_healthy:
-            results["status"] = HealthStatus.UNHEALTHY
+            results[_KEY_STATUS] = HealthStatus.UNHEALTHY
         elif some_degraded:
-            results["status"] = HealthStatus.DEGRADED
+            results[_KEY_STATUS] = HealthStatus.DEGRADED
 
         return results
 
@@ -237,10 +413,8 @@ def health_check(checks: List[DependencyCheck] = None):
             for check in checks:
                 _health_checker.add_check(check)
 
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        return wrapper
+        # Nothing happens per call, so hand back the function unwrapped
+        return func
     return decorator
 
 
@@ -264,9 +438,9 @@ def add_custom_check(name: str, check_fn: Callable) -> None:
     _health_checker.add_custom_check(name, check_fn)
 
 
-async def get_health_status() -> Dict[str, Any]:
+async def get_health_status(max_age: float = HEALTH_CHECK_CACHE_TTL) -> Dict[str, Any]:
     """Get current health status."""
-    return await _health_checker.check_all()
+    return await _health_checker.check_all(max_age)
 
 
 if FASTAPI_AVAILABLE:
@@ -283,17 +457,24 @@ if FASTAPI_AVAILABLE:
             - 200 with status "healthy" or "degraded"
             - 503 with status "unhealthy"
         """
-        status = await get_health_status()
+        status, body = await _health_checker.snapshot()
 
         # Return proper HTTP status codes
-        if status.get("status") == HealthStatus.UNHEALTHY:
-            return JSONResponse(content=status, status_code=503)
-        return status
+        status_code = 503 if status.get(_KEY_STATUS) == HealthStatus.UNHEALTHY else 200
+        return Response(content=body, media_type="application/json", status_code=status_code)
 
     def create_health_app(service_name: str = None) -> "FastAPI":
         """Create a minimal FastAPI app with health check."""
         from fastapi import FastAPI
-        app = FastAPI(title=service_name or "PMOVES Service")
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            yield
+            # Shutdown: release pooled HTTP and NATS connections
+            await aclose_all_http_checks()
+            await _health_checker.close()
+
+        app = FastAPI(title=service_name or "PMOVES Service", lifespan=lifespan)
         app.include_router(health_check_router)
         return app
 else:
@@ -10,16 +10,21 @@ Service discovery using the PMOVES service registry with fallback chain:
 This module provides:
 - CommonServices: Environment-based service URL discovery
 - ServiceInfo: Immutable data class for service metadata
-- get_service_url(): Resolve service URL with fallback chain
-- get_service_info(): Get full service metadata
+- get_service_url() / get_service_url_sync(): Resolve service URL with fallback chain
+- get_service_info() / get_service_info_sync(): Get full service metadata
+- check_service_health(): Probe a service's health endpoint
+- check_services_health(): Probe several services concurrently
+- aclose_registry(): Close the shared health-check HTTP client on shutdown
 
 Usage:
     from pmoves_registry import get_service_url, ServiceInfo, CommonServices
 
     # Simple URL resolution via CommonServices
     url = CommonServices.get("hirag_v2")
+    url = CommonServices["hirag-v2"]
 
-    # Or use the async function with fallback
+    # Or resolve with fallback (sync, or the async wrapper)
+    url = get_service_url_sync("hirag-v2")
     url = await get_service_url("hirag-v2")
 
     # Get full service info
@@ -29,13 +34,30 @@ Usage:
 Environment Variables:
     Services can be configured via environment variables in format:
     {SERVICE_SLUG}_URL (e.g., HIRAG_V2_URL=http://hirag-v2:8086)
+
+    PMOVES_REGISTRY_TTL: Seconds to cache resolved service info (default 20)
+
+    *_URL variables are read once at import; call refresh_env_snapshot()
+    after changing them at runtime.
 """
 
 import asyncio
+import functools
 import os
+import random
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+    HTTPX_AVAILABLE = False
+
+from pmoves_common import LoopLocal
 
 # Import ServiceTier from shared types if available, otherwise define locally
 try:
@@ -53,11 +75,33 @@ except ImportError:
         WORKER = "worker"
 
 
-@dataclass(frozen=True)
+# Tier value -> enum member, avoiding Enum.__call__ for string tiers
+_TIER_CACHE: dict[str, ServiceTier] = {t.value: t for t in ServiceTier}
+
+# Trailing health/metrics paths stripped to derive a service's base URL
+_HEALTH_SUFFIXES = ("/healthz", "/health", "/metrics", "/ping")
+
+
+@functools.lru_cache(maxsize=256)
+def _strip_health_suffix(url: str) -> str:
+    """Strip a trailing health check path and slashes from a URL."""
+    for suffix in _HEALTH_SUFFIXES:
+        stripped = url.removesuffix(suffix)
+        if len(stripped) != len(url):
+            url = stripped
+            break
+    return url.rstrip("/")
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceInfo:
     """
     Immutable service metadata from the service catalog.
 
+    Resolved instances are cached and shared between callers. Frozen only
+    stops attribute assignment; the metadata dict itself is still mutable,
+    so treat it as read-only and copy it before making changes.
+
     Attributes:
         slug: Unique service identifier (e.g., "hirag-v2", "agent-zero")
         name: Human-readable service name
@@ -76,16 +120,25 @@ class ServiceInfo:
     default_port: int | None
     tier: ServiceTier
     metadata: dict[str, Any] = field(default_factory=dict)
+    _base_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Slugs repeat across the catalog; interning shares one string object
+        object.__setattr__(self, "slug", sys.intern(self.slug))
+        if not isinstance(self.tier, ServiceTier):
+            object.__setattr__(self, "tier", _TIER_CACHE.get(self.tier) or ServiceTier(self.tier))
+        object.__setattr__(self, "_base_url", _strip_health_suffix(self.health_check_url))
 
     @property
     def base_url(self) -> str:
-        """Extract base URL from health_check_url."""
-        url = self.health_check_url
-        for suffix in ("/healthz", "/health", "/metrics", "/ping"):
-            if url.endswith(suffix):
-                url = url[: -len(suffix)]
-                break
-        return url.rstrip("/")
+        """Base URL of the service (health_check_url without its health path)."""
+        return self._base_url
+
+
+# Resolved ServiceInfo cache: (slug, default_port) -> (monotonic time, info)
+_CACHE_TTL = float(os.getenv("PMOVES_REGISTRY_TTL", "20"))
+_CACHE_MAXSIZE = 256
+_SERVICE_INFO_CACHE: dict[tuple[str, int], tuple[float, ServiceInfo]] = {}
 
 
 class ServiceNotFoundError(Exception):
@@ -96,6 +149,45 @@ class ServiceNotFoundError(Exception):
         super().__init__(message or f"Service '{slug}' not found in service catalog")
 
 
+def _squash(name: str) -> str:
+    """Canonical form shared by a slug and all of its env var spellings."""
+    return name.upper().replace("-", "").replace("_", "")
+
+
+def _index_env_urls() -> dict[str, dict[str, str]]:
+    """
+    Index *_URL environment variables by the squashed form of their name.
+
+    Every env var pattern for a slug squashes to the same key as the slug
+    itself, so one lookup yields all candidate overrides (usually none).
+    """
+    index: dict[str, dict[str, str]] = {}
+    for key, url in os.environ.items():
+        if key.endswith("_URL"):
+            name = key[:-4]
+            index.setdefault(_squash(name), {})[name] = url
+    return index
+
+
+_ENV_URL_INDEX = _index_env_urls()
+
+
+def refresh_env_snapshot() -> None:
+    """
+    Re-read *_URL environment variables and drop cached resolutions.
+
+    The registry snapshots the environment at import time; call this
+    (e.g. from tests) after changing service URL variables. Circuit
+    breaker state is reset too, since it belonged to the old URLs.
+    """
+    global _ENV_URL_INDEX
+    _ENV_URL_INDEX = _index_env_urls()
+    _get_env_url.cache_clear()
+    _SERVICE_INFO_CACHE.clear()
+    _CIRCUITS.clear()
+
+
+@functools.lru_cache(maxsize=256)
 def _get_env_url(slug: str) -> str | None:
     """
     Check for environment variable override.
@@ -105,20 +197,27 @@ def _get_env_url(slug: str) -> str | None:
     2. <SLUG WITH DASHES>_URL (e.g., HIRAG-V2-URL)
     3. UPPERCASE_SLUG_URL (e.g., HIRAGV2_URL)
 
+    Lookups use an index of the environment built at import time and are
+    cached per slug; call refresh_env_snapshot() after changing it.
+
     Args:
         slug: Service slug (e.g., "hirag-v2")
 
     Returns:
         URL from environment or None
     """
-    env_var_patterns = [
-        slug.upper().replace("-", "_") + "_URL",  # HIRAG_V2_URL
-        slug.upper().replace("-", "") + "_URL",  # HIRAGV2_URL
-        slug.upper() + "_URL",  # HIRAG-V2_URL
-    ]
-
-    for pattern in env_var_patterns:
-        if url := os.getenv(pattern):
+    candidates = _ENV_URL_INDEX.get(_squash(slug))
+    if not candidates:
+        return None
+
+    # Only reached when an override exists; pick by documented precedence
+    upper = slug.upper()
+    for name in (
+        upper.replace("-", "_"),  # HIRAG_V2_URL
+        upper.replace("-", ""),  # HIRAGV2_URL
+        upper,  # HIRAG-V2_URL
+    ):
+        if url := candidates.get(name):
             return url
 
     return None
@@ -138,7 +237,58 @@ def _fallback_dns_url(slug: str, default_port: int) -> str:
     return f"http://{slug}:{default_port}"
 
 
-async def get_service_info(
+# Static descriptions for resolved entries that don't come from the catalog
+_DESC_ENV = "Service URL from environment variable"
+_DESC_DNS = "Service resolved via Docker DNS fallback"
+
+
+@functools.lru_cache(maxsize=256)
+def _display_name(slug: str, source: str) -> str:
+    """Name for an entry resolved outside the catalog, e.g. "hirag-v2 (from env)"."""
+    return f"{slug} ({source})"
+
+
+def _build_service_info(slug: str, default_port: int) -> ServiceInfo:
+    """Build ServiceInfo for a slug from the fallback chain (uncached)."""
+    # 1. Check environment variable override
+    if env_url := _get_env_url(slug):
+        return ServiceInfo(
+            slug=slug,
+            name=_display_name(slug, "from env"),
+            description=_DESC_ENV,
+            health_check_url=env_url,
+            default_port=default_port,
+            tier=ServiceTier.API,  # Default tier
+        )
+
+    # 2. Fallback to DNS-based URL
+    fallback_url = _fallback_dns_url(slug, default_port)
+    return ServiceInfo(
+        slug=slug,
+        name=_display_name(slug, "fallback"),
+        description=_DESC_DNS,
+        health_check_url=fallback_url,
+        default_port=default_port,
+        tier=ServiceTier.API,
+    )
+
+
+def _resolve_service_info(slug: str, default_port: int) -> ServiceInfo:
+    """Resolve ServiceInfo through the TTL cache."""
+    key = (slug, default_port)
+    now = time.monotonic()
+    cached = _SERVICE_INFO_CACHE.get(key)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+
+    info = _build_service_info(slug, default_port)
+    if len(_SERVICE_INFO_CACHE) >= _CACHE_MAXSIZE:
+        _SERVICE_INFO_CACHE.clear()
+    _SERVICE_INFO_CACHE[key] = (now, info)
+    return info
+
+
+def get_service_info_sync(
     slug: str,
     *,
     default_port: int = 80,
@@ -150,6 +300,11 @@ async def get_service_info(
         1. Environment variable override
         2. Constructed URL (with warning)
 
+    Resolved entries are cached for PMOVES_REGISTRY_TTL seconds (default 20),
+    and every caller gets the same instance meanwhile; don't mutate its
+    metadata. Resolution does no I/O, so this can be called from sync code
+    directly.
+
     Args:
         slug: Service slug to resolve
         default_port: Port for fallback URL construction
@@ -160,30 +315,35 @@ async def get_service_info(
     Raises:
         ServiceNotFoundError: If service cannot be resolved
     """
-    # 1. Check environment variable override
-    if env_url := _get_env_url(slug):
-        return ServiceInfo(
-            slug=slug,
-            name=f"{slug} (from env)",
-            description=f"Service URL from environment variable",
-            health_check_url=env_url,
-            default_port=default_port,
-            tier=ServiceTier.API,  # Default tier
-        )
+    return _resolve_service_info(slug, default_port)
 
-    # 2. Fallback to DNS-based URL
-    fallback_url = _fallback_dns_url(slug, default_port)
-    return ServiceInfo(
-        slug=slug,
-        name=f"{slug} (fallback)",
-        description=f"Service resolved via Docker DNS fallback",
-        health_check_url=fallback_url,
-        default_port=default_port,
-        tier=ServiceTier.API,
-    )
 
+async def get_service_info(
+    slug: str,
+    *,
+    default_port: int = 80,
+) -> ServiceInfo:
+    """
+    Async wrapper around get_service_info_sync(), kept for compatibility.
 
-async def get_service_url(
+    Args:
+        slug: Service slug to resolve
+        default_port: Port for fallback URL construction
+
+    Returns:
+        ServiceInfo with service metadata
+    """
+    return _resolve_service_info(slug, default_port)
+
+
+def _fast_resolve(slug: str, default_port: int) -> str:
+    """Resolve a service's base URL without building a ServiceInfo."""
+    if env_url := _get_env_url(slug):
+        return _strip_health_suffix(env_url)
+    return _fallback_dns_url(slug, default_port)
+
+
+def get_service_url_sync(
     slug: str,
     *,
     default_port: int = 80,
@@ -200,12 +360,93 @@ async def get_service_url(
     Returns:
         Resolved service URL
 
+    Example:
+        >>> get_service_url_sync("hirag-v2")
+        "http://hi-rag-gateway-v2:8086"
+    """
+    if use_base_url:
+        return _fast_resolve(slug, default_port)
+    return _resolve_service_info(slug, default_port).health_check_url
+
+
+async def get_service_url(
+    slug: str,
+    *,
+    default_port: int = 80,
+    use_base_url: bool = True,
+) -> str:
+    """
+    Async wrapper around get_service_url_sync(), kept for compatibility.
+
     Example:
         >>> await get_service_url("hirag-v2")
         "http://hi-rag-gateway-v2:8086"
     """
-    info = await get_service_info(slug, default_port=default_port)
-    return info.base_url if use_base_url else info.health_check_url
+    return get_service_url_sync(
+        slug, default_port=default_port, use_base_url=use_base_url
+    )
+
+
+# Shared keep-alive health-probe clients per event loop: timeout -> client.
+# A client is bound to the loop it was created on, so each loop (e.g. per
+# worker) gets its own pool. Timeouts in use are conventional (1, 2, 5,
+# 10s), so the inner dicts stay tiny.
+_HEALTH_CLIENTS: LoopLocal[dict[float, "httpx.AsyncClient"]] = LoopLocal()
+
+# Idle pooled connections outlive typical probe intervals, so warm-path
+# probes reuse an open socket and skip DNS resolution entirely
+_KEEPALIVE_EXPIRY = 60.0
+
+
+def _get_health_client(timeout: float = 5.0):
+    """Return the running loop's health-check AsyncClient for a timeout, creating it if needed."""
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx is required for service health checks")
+
+    clients = _HEALTH_CLIENTS.get()
+    if clients is None:
+        clients = _HEALTH_CLIENTS.set({})
+
+    # Near-equal timeouts share a pool; the client still uses the exact value
+    key = max(round(timeout, 1), 0.1)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = clients[key] = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return client
+
+
+async def aclose_registry() -> None:
+    """Close the running loop's shared health-check clients. Call on shutdown."""
+    clients = _HEALTH_CLIENTS.pop() or {}
+    for client in clients.values():
+        await client.aclose()
+
+
+# Retry/circuit breaker settings for check_service_health()
+_HEALTH_RETRIES = 3
+_BREAKER_THRESHOLD = 3  # Consecutive failed checks before the breaker opens
+_BREAKER_RESET = 30.0  # Seconds an open breaker fails fast before a trial probe
+
+
+class _CircuitState:
+    """Per-service breaker state: closed, open, or half-open after the reset time."""
+
+    __slots__ = ("failures", "opened_at")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: float | None = None
+
+
+# Keyed by (slug, default_port): the fallback URL depends on the port
+_CIRCUITS: dict[tuple[str, int], _CircuitState] = {}
 
 
 async def check_service_health(
@@ -217,24 +458,93 @@ async def check_service_health(
     """
     Check if a service is healthy by calling its health endpoint.
 
+    Probes share one pooled client, so repeated checks reuse connections.
+    Transport errors are retried with jittered exponential backoff, up to
+    _HEALTH_RETRIES attempts. After repeated failed checks a circuit breaker
+    for (slug, default_port) opens, and further checks return False
+    immediately until a trial probe is allowed again.
+
     Args:
         slug: Service slug to check
         default_port: Port for fallback URL construction
-        timeout: HTTP request timeout in seconds
+        timeout: HTTP timeout in seconds per attempt, so a failing check can
+            take about 3x timeout plus backoff before returning
 
     Returns:
         True if service is healthy, False otherwise
     """
-    import httpx
+    client = _get_health_client(timeout)  # Raises ImportError if httpx is missing
+
+    key = (slug, default_port)
+    state = _CIRCUITS.get(key)
+    if state is None:
+        state = _CIRCUITS[key] = _CircuitState()
+
+    half_open = False
+    if state.opened_at is not None:
+        if time.monotonic() - state.opened_at < _BREAKER_RESET:
+            return False  # Open: fail fast
+        half_open = True
+
+    info = _resolve_service_info(slug, default_port)
+    attempts = 1 if half_open else _HEALTH_RETRIES
+
+    for attempt in range(attempts):
+        try:
+            response = await client.get(info.health_check_url, timeout=timeout)
+        except httpx.TransportError:
+            if attempt < attempts - 1:
+                await asyncio.sleep(
+                    min(0.1 * 2**attempt, 2.0) * (0.5 + random.random())
+                )
+            continue
+        except Exception:
+            break
+
+        if response.status_code == 200:
+            state.failures = 0
+            state.opened_at = None
+            return True
+        break  # Service answered but is unhealthy; retrying won't help
+
+    state.failures += 1
+    if half_open or state.failures >= _BREAKER_THRESHOLD:
+        state.opened_at = time.monotonic()
+    return False
+
+
+async def check_services_health(
+    slugs: list[str],
+    *,
+    default_port: int = 80,
+    timeout: float = 5.0,
+    concurrency: int = 20,
+) -> dict[str, bool]:
+    """
+    Check several services concurrently.
+
+    At most `concurrency` probes are in flight at once (a bulkhead), so a
+    fleet-wide check cannot exhaust sockets or the shared client's pool.
 
-    info = await get_service_info(slug, default_port=default_port)
+    Args:
+        slugs: Service slugs to check
+        default_port: Port for fallback URL construction
+        timeout: HTTP timeout in seconds per attempt (see check_service_health)
+        concurrency: Maximum number of simultaneous probes
+
+    Returns:
+        Mapping of slug to health result
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _check(slug: str) -> bool:
+        async with sem:
+            return await check_service_health(
+                slug, default_port=default_port, timeout=timeout
+            )
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(info.health_check_url)
-            return response.status_code == 200
-    except Exception:
-        return False
+    results = await asyncio.gather(*(_check(slug) for slug in slugs))
+    return dict(zip(slugs, results))
 
 
 # Common service URLs for quick reference
@@ -263,10 +573,35 @@ class CommonServices:
     # NATS
     NATS = "nats://nats:4222"
 
+    # Name -> URL and spelling -> URL tables, filled in below the class
+    _REGISTRY: ClassVar[dict[str, str]]
+    _LOOKUP: ClassVar[dict[str, str]]
+
     @classmethod
-    def get(cls, service: str) -> str:
-        """Get a common service URL by name."""
-        return getattr(cls, service.upper(), None)
+    def get(cls, service: str) -> Optional[str]:
+        """Get a common service URL by name or slug (e.g., "hirag_v2", "hirag-v2")."""
+        if (url := cls._LOOKUP.get(service)) is not None:
+            return url
+        return cls._REGISTRY.get(service.upper().replace("-", "_"))
+
+    def __class_getitem__(cls, service: str) -> str:
+        """Subscript lookup: CommonServices["hirag-v2"]. Raises KeyError if unknown."""
+        if (url := cls.get(service)) is None:
+            raise KeyError(service)
+        return url
+
+
+# Name -> URL table so CommonServices.get() is a dict lookup, not getattr
+CommonServices._REGISTRY = {
+    k: v for k, v in vars(CommonServices).items() if k.isupper() and isinstance(v, str)
+}
+
+# Common spellings (HIRAG_V2, hirag_v2, hirag-v2) -> URL, hit without string work
+CommonServices._LOOKUP = {
+    spelling: url
+    for name, url in CommonServices._REGISTRY.items()
+    for spelling in (name, name.lower(), name.lower().replace("_", "-"))
+}
 
 
 if __name__ == "__main__":
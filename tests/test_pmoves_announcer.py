@@ -0,0 +1,334 @@
+"""
+Unit tests for the pmoves_announcer module.
+
+This test suite covers announcement serialization, the cached payload
+that BackgroundAnnouncer re-publishes with a fresh timestamp each tick, and
+the bounded wait on the initial NATS connection.
+"""
+
+import asyncio
+import json
+import socket
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import pmoves_announcer
+from pmoves_announcer import (
+    BackgroundAnnouncer,
+    ServiceAnnouncement,
+    ServiceAnnouncer,
+)
+
+
+class _FakeNATS:
+    """Stand-in for a connected nats Client that records what it was asked to do."""
+
+    def __init__(self):
+        self.published: list[tuple[str, bytes]] = []
+        self.flushes = 0
+        self.is_connected = True
+        self.is_closed = False
+
+    async def publish(self, subject: str, payload: bytes) -> None:
+        self.published.append((subject, payload))
+
+    async def flush(self, timeout: float = 10) -> None:
+        self.flushes += 1
+
+    async def close(self) -> None:
+        self.is_connected = False
+        self.is_closed = True
+
+
+@pytest.fixture
+def nc(announcer):
+    """Attach a fake connected NATS client to the announcer."""
+    client = _FakeNATS()
+    announcer._nc = client
+    return client
+
+
+@pytest.fixture
+def announcer():
+    return ServiceAnnouncer(
+        slug="hi-rag",
+        name="Hi RAG",
+        url="http://hi-rag:8086",
+        port=8086,
+        tier="api",
+        metadata={"version": "2"},
+    )
+
+
+# ============================================================================
+# TEST SUITE 1: BackgroundAnnouncer Payload
+# ============================================================================
+
+
+class TestBackgroundPayload:
+    """Test suite for BackgroundAnnouncer._payload timestamp splicing."""
+
+    def test_payload_matches_fresh_announcement(self, announcer, monkeypatch):
+        """The spliced payload parses to the same message as a fresh one."""
+        now = datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        monkeypatch.setattr(pmoves_announcer, "_utc_now", lambda: now)
+
+        payload = BackgroundAnnouncer(announcer)._payload()
+        expected = announcer.create_announcement(timestamp=now).to_bytes()
+
+        assert json.loads(payload) == json.loads(expected)
+        assert ServiceAnnouncement.from_json(payload).timestamp == now
+
+    def test_payload_has_no_placeholder(self, announcer):
+        """The placeholder token never reaches the wire."""
+        payload = BackgroundAnnouncer(announcer)._payload()
+        assert pmoves_announcer._TIMESTAMP_PLACEHOLDER.encode() not in payload
+
+    def test_template_reused_with_new_timestamp(self, announcer, monkeypatch):
+        """Each tick reuses the cached template but splices a new timestamp."""
+        background = BackgroundAnnouncer(announcer)
+        times = iter(
+            [
+                datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+                datetime(2025, 1, 1, 12, 1, 0, tzinfo=timezone.utc),
+            ]
+        )
+        monkeypatch.setattr(pmoves_announcer, "_utc_now", lambda: next(times))
+
+        first = background._payload()
+        template = background._template
+        second = background._payload()
+
+        assert background._template is template
+        assert json.loads(first)["timestamp"] == "2025-01-01T12:00:00Z"
+        assert json.loads(second)["timestamp"] == "2025-01-01T12:01:00Z"
+
+    def test_invalidate_picks_up_changes(self, announcer):
+        """invalidate() re-serializes after the announcer's fields change."""
+        background = BackgroundAnnouncer(announcer)
+        background._payload()
+
+        announcer.metadata = {"version": "3"}
+        assert json.loads(background._payload())["metadata"] == {"version": "2"}
+
+        background.invalidate()
+        assert json.loads(background._payload())["metadata"] == {"version": "3"}
+
+
+# ============================================================================
+# TEST SUITE 2: ServiceAnnouncement
+# ============================================================================
+
+
+class TestServiceAnnouncement:
+    """Test suite for ServiceAnnouncement serialization."""
+
+    def test_round_trip(self, announcer):
+        """from_json(to_bytes()) reproduces the announcement."""
+        announcement = announcer.create_announcement()
+        assert ServiceAnnouncement.from_json(announcement.to_bytes()) == announcement
+
+    def test_metadata_encoded_like_json_dumps(self, announcer):
+        """Metadata json.dumps accepts (non-str keys, big ints) still serializes."""
+        metadata = {1: "one", None: "none", "big": 2**70}
+        announcer.metadata = metadata
+        data = json.loads(announcer.create_announcement().to_bytes())
+        assert data["metadata"] == json.loads(json.dumps(metadata))
+
+    def test_unknown_tier_rejected(self, announcer):
+        """Parsing a message with an unknown tier raises ValueError."""
+        data = json.loads(announcer.create_announcement().to_bytes())
+        data["tier"] = "unknown"
+        with pytest.raises(ValueError):
+            ServiceAnnouncement.from_json(data)
+
+
+# ============================================================================
+# TEST SUITE 3: Serialization Failures
+# ============================================================================
+
+
+class TestSerializationFailures:
+    """Unserializable metadata is reported as a failed announce, not raised."""
+
+    @pytest.fixture
+    def bad_announcer(self, announcer):
+        announcer.metadata = {"tags": {1, 2}}  # Sets are not JSON serializable
+        return announcer
+
+    @pytest.mark.asyncio
+    async def test_announce_returns_false(self, bad_announcer, nc):
+        assert await bad_announcer.announce() is False
+        assert await bad_announcer.announce_sync() is False
+        assert nc.published == []
+
+    @pytest.mark.asyncio
+    async def test_announce_with_retry_returns_false(self, bad_announcer, nc):
+        assert await bad_announcer.announce_with_retry(max_retries=2, delay=0) is False
+
+    @pytest.mark.asyncio
+    async def test_background_start_survives(self, bad_announcer, nc):
+        background = BackgroundAnnouncer(bad_announcer, interval=0.01)
+        await background.start()
+        await asyncio.sleep(0.03)
+
+        assert not background._task.done()  # Loop keeps running
+        await background.stop()
+        assert nc.published == []
+
+
+# ============================================================================
+# TEST SUITE 4: Publishing
+# ============================================================================
+
+
+class TestPublishing:
+    """Test suite for flush behaviour of announce(), announce_sync() and close()."""
+
+    @pytest.mark.asyncio
+    async def test_announce_does_not_flush(self, announcer, nc):
+        """announce() queues the message without a flush round-trip."""
+        assert await announcer.announce() is True
+        assert [subject for subject, _ in nc.published] == [ServiceAnnouncement.SUBJECT]
+        assert nc.flushes == 0
+
+    @pytest.mark.asyncio
+    async def test_announce_sync_flushes(self, announcer, nc):
+        """announce_sync() flushes after publishing."""
+        assert await announcer.announce_sync() is True
+        assert len(nc.published) == 1
+        assert nc.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drains_and_closes(self, announcer, nc):
+        """close() flushes pending announcements, then closes the client."""
+        await announcer.announce()
+        await announcer.close()
+
+        assert nc.flushes == 1
+        assert nc.is_closed
+        assert announcer._nc is None
+
+    @pytest.mark.asyncio
+    async def test_close_skips_flush_when_disconnected(self, announcer, nc):
+        """A disconnected client is closed without attempting a flush."""
+        nc.is_connected = False
+        await announcer.close()
+
+        assert nc.flushes == 0
+        assert nc.is_closed
+
+
+# ============================================================================
+# TEST SUITE 5: Retry Backoff
+# ============================================================================
+
+
+class TestRetryBackoff:
+    """Test suite for announce_with_retry() backoff."""
+
+    @pytest.fixture
+    def sleeps(self, announcer, monkeypatch):
+        """Make every attempt fail and record the backoff sleeps."""
+        recorded: list[float] = []
+
+        async def fail():
+            return False
+
+        async def sleep(seconds):
+            recorded.append(seconds)
+
+        monkeypatch.setattr(announcer, "announce_sync", fail)
+        monkeypatch.setattr(pmoves_announcer.asyncio, "sleep", sleep)
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_exponential_with_jitter(self, announcer, sleeps):
+        """Sleeps double per attempt with at most 25% jitter, none after the last."""
+        assert await announcer.announce_with_retry(max_retries=4, delay=1.0) is False
+
+        assert len(sleeps) == 3
+        for i, slept in enumerate(sleeps):
+            assert 2**i <= slept <= 2**i + 0.25
+
+    @pytest.mark.asyncio
+    async def test_capped_at_max_delay(self, announcer, sleeps):
+        """No single sleep exceeds MAX_RETRY_DELAY."""
+        await announcer.announce_with_retry(max_retries=5, delay=20.0)
+
+        assert sleeps[0] >= 20.0
+        assert sleeps[1:] == [pmoves_announcer.MAX_RETRY_DELAY] * 3
+
+    @pytest.mark.asyncio
+    async def test_success_stops_retrying(self, announcer, monkeypatch):
+        """A successful attempt returns without further sleeps."""
+        results = iter([False, True])
+
+        async def attempt():
+            return next(results)
+
+        slept: list[float] = []
+
+        async def sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr(announcer, "announce_sync", attempt)
+        monkeypatch.setattr(pmoves_announcer.asyncio, "sleep", sleep)
+
+        assert await announcer.announce_with_retry(max_retries=5, delay=1.0) is True
+        assert len(slept) == 1
+
+
+# ============================================================================
+# TEST SUITE 6: Initial Connection
+# ============================================================================
+
+
+class TestInitialConnect:
+    """Test suite for publishing while NATS is unreachable."""
+
+    @pytest.fixture
+    def dead_announcer(self):
+        pytest.importorskip("nats")
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        return ServiceAnnouncer(
+            slug="hi-rag",
+            name="Hi RAG",
+            url="http://hi-rag:8086",
+            port=8086,
+            tier="api",
+            nats_url=f"nats://127.0.0.1:{port}",
+            connect_timeout=0.1,
+        )
+
+    def test_default_timeout(self, announcer):
+        assert announcer.connect_timeout == pmoves_announcer.NATS_CONNECT_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_announce_gives_up_after_connect_timeout(self, dead_announcer):
+        """announce() returns False after connect_timeout, not the full retry."""
+        try:
+            start = time.perf_counter()
+            assert await dead_announcer.announce() is False
+            assert time.perf_counter() - start < 1.0
+        finally:
+            await dead_announcer.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_kept_across_attempts(self, dead_announcer):
+        """A timed-out publish leaves the background connect running."""
+        try:
+            await dead_announcer.announce()
+            task = dead_announcer._connect_task
+            await dead_announcer.announce()
+
+            assert dead_announcer._connect_task is task
+            assert not task.done()
+        finally:
+            await dead_announcer.close()
+
+        assert task.cancelled()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the pmoves_common module.
+
+This test suite covers the shared enums, the LoopLocal per-event-loop
+storage used for pooled clients, and the throttled NATS error callback.
+"""
+
+import asyncio
+
+import pmoves_common
+from pmoves_common import HealthStatus, LoopLocal, ServiceTier, nats_error_cb
+
+# ============================================================================
+# TEST SUITE 1: Shared Enums
+# ============================================================================
+
+
+class TestEnums:
+    """Test suite for ServiceTier and HealthStatus."""
+
+    def test_tier_is_valid(self):
+        assert ServiceTier.is_valid("api")
+        assert not ServiceTier.is_valid("unknown")
+
+    def test_str_is_plain_value(self):
+        assert str(ServiceTier.API) == "api"
+        assert f"{HealthStatus.DEGRADED}" == "degraded"
+
+
+# ============================================================================
+# TEST SUITE 2: LoopLocal
+# ============================================================================
+
+
+class TestLoopLocal:
+    """Test suite for LoopLocal."""
+
+    def test_value_per_loop(self):
+        """Each event loop sees only the value it stored."""
+        local: LoopLocal[object] = LoopLocal()
+
+        async def store():
+            assert local.get() is None
+            return local.set(object())
+
+        async def fetch():
+            return local.get()
+
+        loop = asyncio.new_event_loop()
+        try:
+            value = loop.run_until_complete(store())
+            assert loop.run_until_complete(fetch()) is value
+            assert asyncio.run(fetch()) is None
+        finally:
+            loop.close()
+
+    def test_closed_loops_dropped(self):
+        """Entries of closed loops are dropped when another loop stores a value."""
+        local: LoopLocal[int] = LoopLocal()
+
+        async def store(value):
+            local.set(value)
+
+        for value in range(3):
+            asyncio.run(store(value))
+
+        assert len(local._entries) == 1
+
+    def test_pop(self):
+        """pop() removes and returns only the running loop's value."""
+        local: LoopLocal[str] = LoopLocal()
+
+        async def run():
+            local.set("value")
+            assert local.pop() == "value"
+            assert local.pop() is None
+
+        asyncio.run(run())
+
+
+# ============================================================================
+# TEST SUITE 3: NATS Error Callback
+# ============================================================================
+
+
+class TestNATSErrorCallback:
+    """Test suite for nats_error_cb throttling."""
+
+    def _errors(self, cb, errors):
+        async def run():
+            for error in errors:
+                await cb(error)
+
+        asyncio.run(run())
+
+    def test_repeats_suppressed(self, capsys):
+        """The same error is printed once within the interval."""
+        cb = nats_error_cb("svc", interval=60)
+        self._errors(cb, [ConnectionRefusedError("refused")] * 5)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["svc: NATS error: ConnectionRefusedError: refused"]
+
+    def test_new_error_printed(self, capsys):
+        """A different error is printed immediately."""
+        cb = nats_error_cb("svc", interval=60)
+        self._errors(cb, [OSError("a"), OSError("a"), TimeoutError("b")])
+
+        assert len(capsys.readouterr().out.splitlines()) == 2
+
+    def test_repeated_after_interval(self, capsys, monkeypatch):
+        """The same error is printed again once the interval has passed."""
+        now = [0.0]
+        monkeypatch.setattr(pmoves_common.time, "monotonic", lambda: now[0])
+        cb = nats_error_cb("svc", interval=60)
+
+        self._errors(cb, [OSError("a")])
+        now[0] = 61.0
+        self._errors(cb, [OSError("a")])
+
+        assert len(capsys.readouterr().out.splitlines()) == 2
@@ -0,0 +1,343 @@
+"""
+Unit tests for the pmoves_health module.
+
+This test suite covers HealthChecker status aggregation, the short-lived
+result cache behind snapshot() and check_all(), DatabaseCheck dispatch, and
+NATSCheck's background connection.
+"""
+
+import asyncio
+import json
+import socket
+import time
+
+import pytest
+
+import pmoves_health
+from pmoves_health import (
+    DatabaseCheck,
+    DependencyCheck,
+    HealthChecker,
+    HealthStatus,
+    NATSCheck,
+)
+
+
+class _CountingCheck(DependencyCheck):
+    """Check that records how often it ran and returns a scripted result."""
+
+    __slots__ = ("result", "calls")
+
+    def __init__(self, name: str = "dep", result: bool = True, **kwargs):
+        super().__init__(name, kwargs.get("required", True))
+        self.result = result
+        self.calls = 0
+
+    async def check(self) -> bool:
+        self.calls += 1
+        return self.result
+
+
+class _HangingCheck(DependencyCheck):
+    """Check that never finishes on its own."""
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self, name: str = "slow", **kwargs):
+        super().__init__(name, kwargs.get("required", True))
+        self.cancelled = False
+
+    async def check(self) -> bool:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return True
+
+
+# ============================================================================
+# TEST SUITE 1: Snapshot Cache
+# ============================================================================
+
+
+class TestSnapshotCache:
+    """Test suite for HealthChecker.snapshot() caching."""
+
+    @pytest.mark.asyncio
+    async def test_reused_within_ttl(self):
+        """A second snapshot inside max_age is served from cache."""
+        checker = HealthChecker("svc")
+        check = _CountingCheck()
+        checker.add_check(check)
+
+        first, body = await checker.snapshot(max_age=60)
+        second, second_body = await checker.snapshot(max_age=60)
+
+        assert check.calls == 1
+        assert second is first
+        assert second_body is body
+        assert json.loads(body)["dep_connected"] is True
+
+    @pytest.mark.asyncio
+    async def test_rerun_after_ttl(self):
+        """max_age=0 forces the checks to run again."""
+        checker = HealthChecker("svc")
+        check = _CountingCheck()
+        checker.add_check(check)
+
+        await checker.snapshot(max_age=60)
+        await checker.snapshot(max_age=0)
+
+        assert check.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_add_check_clears_cache(self):
+        """Adding a check invalidates the cached result."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck("first"))
+        await checker.snapshot(max_age=60)
+
+        checker.add_check(_CountingCheck("second"))
+        results, _ = await checker.snapshot(max_age=60)
+
+        assert results["second_connected"] is True
+
+    @pytest.mark.asyncio
+    async def test_add_custom_check_clears_cache(self):
+        """Adding a custom check invalidates the cached result."""
+        checker = HealthChecker("svc")
+        await checker.snapshot(max_age=60)
+
+        checker.add_custom_check("disk_ok", lambda: False)
+        results, _ = await checker.snapshot(max_age=60)
+
+        assert results["disk_ok"] is False
+        assert results["status"] == HealthStatus.UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self):
+        """Concurrent snapshots while the cache is cold run the checks once."""
+        checker = HealthChecker("svc")
+        check = _CountingCheck()
+        checker.add_check(check)
+
+        await asyncio.gather(*(checker.snapshot(max_age=60) for _ in range(5)))
+
+        assert check.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_check_all_returns_copy(self):
+        """Mutating check_all()'s result does not corrupt the cache."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck())
+
+        status = await checker.check_all(max_age=60)
+        status["status"] = "tampered"
+
+        assert (await checker.check_all(max_age=60))["status"] == HealthStatus.HEALTHY
+
+    def test_usable_from_several_loops(self):
+        """The same checker can be snapshotted from successive event loops."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck())
+
+        async def run():
+            await asyncio.gather(*(checker.snapshot(max_age=0) for _ in range(3)))
+
+        asyncio.run(run())
+        asyncio.run(run())
+
+
+# ============================================================================
+# TEST SUITE 2: Status Aggregation
+# ============================================================================
+
+
+class TestStatusAggregation:
+    """Test suite for how check results combine into the overall status."""
+
+    @pytest.fixture(autouse=True)
+    def short_timeout(self, monkeypatch):
+        monkeypatch.setattr(pmoves_health, "HEALTH_CHECK_TIMEOUT", 0.05)
+
+    @pytest.mark.asyncio
+    async def test_hanging_optional_check_degrades(self):
+        """A fast required check plus a hanging optional one is degraded."""
+        checker = HealthChecker("svc")
+
+        async def connect():
+            return True
+
+        checker.database(connect)
+        slow = _HangingCheck(required=False)
+        checker.add_check(slow)
+
+        results = await checker.check_all(max_age=0)
+        await asyncio.sleep(0)  # Let the cancellation land
+
+        assert results["database_connected"] is True
+        assert results["slow_connected"] is False
+        assert results["status"] == HealthStatus.DEGRADED
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_hanging_required_check_unhealthy(self):
+        """A required check that times out makes the service unhealthy."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck())
+        checker.add_check(_HangingCheck())
+
+        results = await checker.check_all(max_age=0)
+
+        assert results["dep_connected"] is True
+        assert results["slow_connected"] is False
+        assert results["status"] == HealthStatus.UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_errors_count_as_failures(self):
+        """A check that raises is reported as failing, not propagated."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck())
+
+        def broken():
+            raise RuntimeError("boom")
+
+        checker.add_custom_check("broken", broken)
+        results = await checker.check_all(max_age=0)
+
+        assert results["broken"] is False
+        assert results["status"] == HealthStatus.UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_all_passing_healthy(self):
+        """All checks passing reports healthy."""
+        checker = HealthChecker("svc")
+        checker.add_check(_CountingCheck())
+        checker.add_check(_CountingCheck("optional", required=False))
+
+        results = await checker.check_all(max_age=0)
+
+        assert results["status"] == HealthStatus.HEALTHY
+        assert str(results["status"]) == "healthy"
+
+
+# ============================================================================
+# TEST SUITE 3: Database Check
+# ============================================================================
+
+
+class TestDatabaseCheck:
+    """Test suite for how DatabaseCheck calls its connect function."""
+
+    @pytest.fixture
+    def to_thread_calls(self, monkeypatch):
+        """Record functions handed to asyncio.to_thread."""
+        calls = []
+        real_to_thread = asyncio.to_thread
+
+        async def to_thread(fn, *args, **kwargs):
+            calls.append(fn)
+            return await real_to_thread(fn, *args, **kwargs)
+
+        monkeypatch.setattr(pmoves_health.asyncio, "to_thread", to_thread)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_async_connect_awaited_directly(self, to_thread_calls):
+        """An async connect_fn is awaited on the loop, not in a thread."""
+        async def connect():
+            return True
+
+        assert await DatabaseCheck(connect).check() is True
+        assert to_thread_calls == []
+
+    @pytest.mark.asyncio
+    async def test_sync_connect_runs_in_thread(self, to_thread_calls):
+        """A sync connect_fn runs through asyncio.to_thread."""
+        def connect():
+            return True
+
+        assert await DatabaseCheck(connect).check() is True
+        assert to_thread_calls == [connect]
+
+    @pytest.mark.asyncio
+    async def test_connect_error_is_failure(self):
+        """A connect_fn that raises reports False."""
+        async def connect():
+            raise ConnectionError("down")
+
+        assert await DatabaseCheck(connect).check() is False
+
+
+# ============================================================================
+# TEST SUITE 4: NATS Check
+# ============================================================================
+
+
+@pytest.fixture
+def dead_nats_url():
+    """URL of a local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"nats://127.0.0.1:{port}"
+
+
+class TestNATSCheck:
+    """Test suite for NATSCheck against an unreachable server."""
+
+    @pytest.fixture(autouse=True)
+    def _nats_installed(self):
+        pytest.importorskip("nats")
+
+    @pytest.mark.asyncio
+    async def test_probe_does_not_wait_for_connect(self, dead_nats_url):
+        """Probes report False immediately while the connect retries."""
+        check = NATSCheck(dead_nats_url)
+        try:
+            await check.check()  # Imports nats and starts the connect
+            start = time.perf_counter()
+            for _ in range(3):
+                assert await check.check() is False
+            assert time.perf_counter() - start < 0.5
+        finally:
+            await check.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_started_once(self, dead_nats_url):
+        """Repeated probes reuse the pending background connect."""
+        check = NATSCheck(dead_nats_url)
+        try:
+            await check.check()
+            conn = check._conns.get()
+            await check.check()
+            assert check._conns.get() is conn
+        finally:
+            await check.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_logged_without_traceback(self, dead_nats_url, capsys):
+        """A failed connect prints a single line instead of a traceback."""
+        check = NATSCheck(dead_nats_url)
+        try:
+            await check.check()
+            await asyncio.sleep(0.2)  # First attempt fails
+        finally:
+            await check.close()
+
+        captured = capsys.readouterr()
+        assert captured.out.count("NATS error") == 1
+        assert "Traceback" not in captured.err
+
+    def test_client_per_loop(self, dead_nats_url):
+        """Each event loop gets its own client."""
+        check = NATSCheck(dead_nats_url)
+
+        async def probe():
+            await check.check()
+            nc = check._conns.get()[0]
+            await check.close()
+            return nc
+
+        assert asyncio.run(probe()) is not asyncio.run(probe())
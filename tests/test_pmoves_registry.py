@@ -0,0 +1,334 @@
+"""
+Unit tests for the pmoves_registry module.
+
+This test suite covers ServiceInfo, URL resolution from the environment,
+the circuit breaker around check_service_health(), check_services_health()
+fan-out, and the CommonServices lookup table.
+"""
+
+import asyncio
+import copy
+import json
+from dataclasses import asdict
+
+import pytest
+
+import pmoves_registry
+from pmoves_registry import (
+    CommonServices,
+    ServiceInfo,
+    ServiceTier,
+    get_service_url_sync,
+    refresh_env_snapshot,
+)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Set *_URL overrides and re-index them; restores the snapshot afterwards."""
+
+    def set_urls(**urls: str) -> None:
+        for name, url in urls.items():
+            monkeypatch.setenv(name, url)
+        refresh_env_snapshot()
+
+    yield set_urls
+    monkeypatch.undo()
+    refresh_env_snapshot()
+
+
+# ============================================================================
+# TEST SUITE 1: ServiceInfo
+# ============================================================================
+
+
+class TestServiceInfo:
+    """Test suite for the ServiceInfo dataclass."""
+
+    def _info(self, **kwargs) -> ServiceInfo:
+        return ServiceInfo(
+            slug="hi-rag",
+            name="Hi RAG",
+            description="Test service",
+            health_check_url="http://hi-rag:8086/healthz",
+            default_port=8086,
+            tier=ServiceTier.API,
+            **kwargs,
+        )
+
+    def test_asdict_default_metadata(self):
+        """asdict, deepcopy and json.dumps work when metadata is defaulted."""
+        info = self._info()
+        data = asdict(info)
+
+        assert data["metadata"] == {}
+        assert data["slug"] == "hi-rag"
+        assert copy.deepcopy(info) == info
+        assert json.loads(json.dumps(data, default=str))["metadata"] == {}
+
+    def test_default_metadata_not_shared(self):
+        """Each instance gets its own metadata dict."""
+        assert self._info().metadata is not self._info().metadata
+
+    def test_base_url_strips_health_suffix(self):
+        """The base URL drops the health check path."""
+        assert self._info().base_url == "http://hi-rag:8086"
+
+
+# ============================================================================
+# TEST SUITE 2: Environment Overrides
+# ============================================================================
+
+
+class TestEnvOverrides:
+    """Test suite for *_URL override lookup through _ENV_URL_INDEX."""
+
+    def test_underscore_spelling_wins(self, env):
+        """HIRAG_V2_URL takes precedence over the other spellings."""
+        env(
+            HIRAG_V2_URL="http://underscore:1",
+            HIRAGV2_URL="http://squashed:1",
+            **{"HIRAG-V2_URL": "http://dashed:1"},
+        )
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://underscore:1"
+
+    def test_squashed_spelling_before_dashed(self, env):
+        """HIRAGV2_URL is used before HIRAG-V2_URL."""
+        env(HIRAGV2_URL="http://squashed:1", **{"HIRAG-V2_URL": "http://dashed:1"})
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://squashed:1"
+
+    def test_dashed_spelling_last(self, env):
+        """HIRAG-V2_URL is used when it is the only override."""
+        env(**{"HIRAG-V2_URL": "http://dashed:1"})
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://dashed:1"
+
+    def test_same_squashed_key_other_spelling_ignored(self, env):
+        """A variable sharing the index key but no documented spelling is ignored."""
+        env(HI_RAG_V2_URL="http://other:1")
+        assert "HIRAGV2" in pmoves_registry._ENV_URL_INDEX
+        assert pmoves_registry._get_env_url("hirag-v2") is None
+
+    def test_no_override_falls_back_to_dns(self, env):
+        """Without an override the Docker DNS fallback URL is returned."""
+        env()
+        assert get_service_url_sync("hirag-v2", default_port=8086) == (
+            "http://hirag-v2:8086"
+        )
+
+    def test_override_used_for_service_url(self, env):
+        """get_service_url_sync() returns the override's base URL."""
+        env(HIRAG_V2_URL="http://hirag:9999")
+        assert get_service_url_sync("hirag-v2") == "http://hirag:9999"
+
+    def test_refresh_picks_up_changes(self, env, monkeypatch):
+        """refresh_env_snapshot() drops cached lookups after the env changes."""
+        env(HIRAG_V2_URL="http://old:1")
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://old:1"
+
+        monkeypatch.setenv("HIRAG_V2_URL", "http://new:1")
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://old:1"
+        refresh_env_snapshot()
+        assert pmoves_registry._get_env_url("hirag-v2") == "http://new:1"
+
+
+# ============================================================================
+# TEST SUITE 3: Health Check Circuit Breaker
+# ============================================================================
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class _FakeClient:
+    """Stand-in for the pooled AsyncClient that serves scripted results."""
+
+    def __init__(self):
+        self.status_code = 200
+        self.error: Exception | None = None
+        self.calls = 0
+
+    async def get(self, url, timeout=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return _FakeResponse(self.status_code)
+
+
+@pytest.fixture
+def health_client(env, monkeypatch):
+    """Route check_service_health() through a fake client with fresh breakers."""
+    env()  # Also clears _CIRCUITS
+    client = _FakeClient()
+    monkeypatch.setattr(pmoves_registry, "_get_health_client", lambda timeout: client)
+    return client
+
+
+def _open_for(slug: str, default_port: int = 80) -> bool:
+    state = pmoves_registry._CIRCUITS.get((slug, default_port))
+    return state is not None and state.opened_at is not None
+
+
+def _expire(slug: str, default_port: int = 80) -> None:
+    """Age an open breaker past its reset time so the next check is a trial."""
+    state = pmoves_registry._CIRCUITS[(slug, default_port)]
+    state.opened_at -= pmoves_registry._BREAKER_RESET + 1
+
+
+class TestCircuitBreaker:
+    """Test suite for the breaker in check_service_health()."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self, health_client):
+        """Consecutive failed checks open the breaker, which then fails fast."""
+        health_client.status_code = 503
+        for _ in range(pmoves_registry._BREAKER_THRESHOLD):
+            assert await pmoves_registry.check_service_health("svc") is False
+        assert _open_for("svc")
+
+        calls = health_client.calls
+        health_client.status_code = 200
+        assert await pmoves_registry.check_service_health("svc") is False
+        assert health_client.calls == calls  # No request while open
+
+    @pytest.mark.asyncio
+    async def test_half_open_success_closes(self, health_client):
+        """A successful trial probe after the reset time closes the breaker."""
+        health_client.status_code = 503
+        for _ in range(pmoves_registry._BREAKER_THRESHOLD):
+            await pmoves_registry.check_service_health("svc")
+        _expire("svc")
+
+        health_client.status_code = 200
+        assert await pmoves_registry.check_service_health("svc") is True
+        assert not _open_for("svc")
+        assert pmoves_registry._CIRCUITS[("svc", 80)].failures == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_failure_reopens(self, health_client):
+        """A failed trial probe is a single attempt and reopens the breaker."""
+        health_client.error = pmoves_registry.httpx.ConnectError("down")
+        for _ in range(pmoves_registry._BREAKER_THRESHOLD):
+            await pmoves_registry.check_service_health("svc")
+        _expire("svc")
+
+        calls = health_client.calls
+        assert await pmoves_registry.check_service_health("svc") is False
+        assert health_client.calls == calls + 1
+        assert _open_for("svc")
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_retried(self, health_client):
+        """Transport errors are retried up to _HEALTH_RETRIES times per check."""
+        health_client.error = pmoves_registry.httpx.ConnectError("down")
+        assert await pmoves_registry.check_service_health("svc") is False
+        assert health_client.calls == pmoves_registry._HEALTH_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_breaker_keyed_by_port(self, health_client):
+        """An open breaker for one default_port leaves other ports alone."""
+        health_client.status_code = 503
+        for _ in range(pmoves_registry._BREAKER_THRESHOLD):
+            await pmoves_registry.check_service_health("svc", default_port=8080)
+        assert _open_for("svc", 8080)
+
+        health_client.status_code = 200
+        assert await pmoves_registry.check_service_health("svc", default_port=9090)
+
+    @pytest.mark.asyncio
+    async def test_refresh_resets_breakers(self, health_client):
+        """refresh_env_snapshot() clears breaker state."""
+        health_client.status_code = 503
+        for _ in range(pmoves_registry._BREAKER_THRESHOLD):
+            await pmoves_registry.check_service_health("svc")
+        assert _open_for("svc")
+
+        refresh_env_snapshot()
+        health_client.status_code = 200
+        assert await pmoves_registry.check_service_health("svc") is True
+
+
+# ============================================================================
+# TEST SUITE 4: Bulk Health Checks
+# ============================================================================
+
+
+class _InFlightClient:
+    """Fake client that fails URLs containing "down" and tracks concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, timeout=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return _FakeResponse(503 if "down" in url else 200)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def in_flight_client(env, monkeypatch):
+    env()
+    client = _InFlightClient()
+    monkeypatch.setattr(pmoves_registry, "_get_health_client", lambda timeout: client)
+    return client
+
+
+class TestCheckServicesHealth:
+    """Test suite for check_services_health()."""
+
+    @pytest.mark.asyncio
+    async def test_results_keyed_by_slug(self, in_flight_client):
+        """Each slug maps to its own result, in input order."""
+        results = await pmoves_registry.check_services_health(["up-a", "down-b", "up-c"])
+
+        assert results == {"up-a": True, "down-b": False, "up-c": True}
+        assert list(results) == ["up-a", "down-b", "up-c"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited(self, in_flight_client):
+        """No more than `concurrency` probes are in flight at once."""
+        slugs = [f"svc-{i}" for i in range(10)]
+        results = await pmoves_registry.check_services_health(slugs, concurrency=3)
+
+        assert all(results.values())
+        assert in_flight_client.max_in_flight == 3
+
+
+# ============================================================================
+# TEST SUITE 5: CommonServices
+# ============================================================================
+
+
+class TestCommonServices:
+    """Test suite for CommonServices lookups."""
+
+    def test_subscript_lookup(self):
+        """CommonServices["hirag-v2"] returns the URL."""
+        assert CommonServices["hirag-v2"] == CommonServices.HIRAG_V2
+
+    @pytest.mark.parametrize(
+        "spelling", ["HIRAG_V2", "hirag_v2", "hirag-v2", "HiRag-V2"]
+    )
+    def test_spellings(self, spelling):
+        """Constant, lower-case, dashed and mixed-case spellings all resolve."""
+        assert CommonServices.get(spelling) == CommonServices.HIRAG_V2
+
+    def test_lookup_covers_every_constant(self):
+        """Each class constant has its three precomputed spellings."""
+        for name, url in vars(CommonServices).items():
+            if name.isupper() and isinstance(url, str):
+                for spelling in (name, name.lower(), name.lower().replace("_", "-")):
+                    assert CommonServices._LOOKUP[spelling] == url
+        assert "_REGISTRY" not in CommonServices._REGISTRY
+
+    def test_unknown_service(self):
+        """get() returns None and subscripting raises KeyError."""
+        assert CommonServices.get("unknown") is None
+        with pytest.raises(KeyError):
+            CommonServices["unknown"]